@@ -16,7 +16,12 @@ def ensure_coverage_tracking():
     yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anyio_backend():
-    """Configure anyio to use asyncio backend."""
+    """Configure anyio to use asyncio backend.
+    
+    Session-scoped so that async fixtures with a scope wider than function
+    (module, session) can be used; anyio requires anyio_backend to have at
+    least the scope of the async fixtures that depend on it.
+    """
     return "asyncio"
\ No newline at end of file
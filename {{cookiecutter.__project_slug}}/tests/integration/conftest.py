@@ -5,19 +5,30 @@ transport protocols (STDIO and Streamable HTTP).
 """
 
 import asyncio
+import errno
+import inspect
 import os
+import re
+import select
+import socket
 import sys
 import subprocess
 import time
 import signal
 import atexit
+import threading
+import httpx
 import psutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import AsyncGenerator, Tuple, Optional, List
 import pytest
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client, get_default_environment
 
+# Whether this MCP SDK version's stdio_client accepts an errlog argument
+_STDIO_CLIENT_HAS_ERRLOG = 'errlog' in inspect.signature(stdio_client).parameters
+
 # Conditional import for streamable_http
 try:
     from fastmcp import Client
@@ -30,6 +41,115 @@ except ImportError:
 # Mark all tests in this module as async
 pytestmark = pytest.mark.anyio
 
+# Project root (containing the server package) and module run by server subprocesses
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_SERVER_MODULE = "{{ cookiecutter.__project_slug }}.server.app"
+
+# Set MCP_TEST_DEBUG=1 to see the HTTP server subprocess output
+_DEBUG_SERVER_OUTPUT = os.environ.get("MCP_TEST_DEBUG", "false").lower() in ("1", "true")
+
+# connect_ex() results meaning a non-blocking connect is still in progress
+# (WSAEWOULDBLOCK is reported as EWOULDBLOCK on Windows)
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EALREADY, errno.EWOULDBLOCK}
+
+# Coverage settings forwarded to stdio server subprocesses
+_COVERAGE_VARS = frozenset({
+    "COVERAGE_PROCESS_START",
+    "COVERAGE_FILE",
+    "COVERAGE_CORE",
+    "COV_CORE_SOURCE",
+    "COV_CORE_CONFIG",
+    "COV_CORE_DATAFILE",
+})
+
+# Matches the owning process IDs in `ss -p` output, e.g. users:(("python",pid=1234,fd=6))
+_SS_PID_RE = re.compile(r"pid=(\d+)")
+
+
+def _wait_pidfd(proc: subprocess.Popen, timeout: float) -> int:
+    """Wait for a subprocess to exit, blocking in the kernel where possible.
+    
+    On Linux 5.3+ a pidfd becomes readable as soon as the child exits, so poll()
+    wakes up immediately instead of going through Popen.wait()'s sleep/waitpid
+    loop. Falls back to Popen.wait() on other platforms.
+    
+    Args:
+        proc: Subprocess to wait for
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        The process return code
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout
+    """
+    # Once Popen has reaped the child its PID may belong to an unrelated process
+    if proc.returncode is not None:
+        return proc.returncode
+    
+    try:
+        fd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        # No pidfd support, or the process exited and was reaped meanwhile
+        return proc.wait(timeout=timeout)
+    
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(fd)
+    
+    # The child has exited, so this only reaps it
+    return proc.wait()
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process still exists without signalling it.
+    
+    On Windows os.kill(pid, 0) would terminate the process, so the process handle
+    is queried instead.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        SYNCHRONIZE = 0x00100000
+        WAIT_TIMEOUT = 0x00000102
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return False
+        try:
+            return kernel32.WaitForSingleObject(handle, 0) == WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists but owned by another user
+    return True
+
+
+def _terminate_process(proc: subprocess.Popen, timeout: float = 2) -> None:
+    """Terminate a subprocess, escalating to kill() if it does not exit in time.
+    
+    Args:
+        proc: Subprocess to stop
+        timeout: Time to wait after each of terminate() and kill()
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process survives kill() as well
+    """
+    proc.terminate()
+    try:
+        _wait_pidfd(proc, timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        _wait_pidfd(proc, timeout)
+
 
 class StreamableHTTPServer:
     """Manager for Streamable HTTP server process with guaranteed cleanup."""
@@ -40,8 +160,8 @@ class StreamableHTTPServer:
     def __init__(self, port: int = {{ cookiecutter.server_port }}):
         self.port = port
         self.process: Optional[subprocess.Popen] = None
-        self.project_root = Path(__file__).parent.parent.parent
-        self.server_module = "{{ cookiecutter.__project_slug }}.server.app"
+        self.project_root = _PROJECT_ROOT
+        self.server_module = _SERVER_MODULE
         self._cleanup_registered = False
     
     def start(self) -> None:
@@ -56,12 +176,14 @@ class StreamableHTTPServer:
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.project_root)
         
-        # Start server process
+        # Start server process. Its output only goes to the test output when
+        # debugging, otherwise every log line would pass through pytest's capture
+        output = None if _DEBUG_SERVER_OUTPUT else subprocess.DEVNULL
         self.process = subprocess.Popen(
             [sys.executable, "-m", self.server_module, "--transport", "http", "--port", str(self.port)],
             env=env,
-            stdout=sys.stdout,  # Let server output go to test output for debugging
-            stderr=sys.stderr,
+            stdout=output,
+            stderr=output,
             cwd=str(self.project_root)
         )
         
@@ -71,28 +193,88 @@ class StreamableHTTPServer:
             self._cleanup_registered = True
         
         # Wait for server to be ready with health check
-        import socket
         max_wait = 30  # Maximum wait time in seconds
-        wait_interval = 0.5
-        waited = 0
-        
-        while waited < max_wait:
-            time.sleep(wait_interval)
-            waited += wait_interval
-            
-            # Check if server is accepting connections
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            try:
-                result = sock.connect_ex(("127.0.0.1", self.port))
-                if result == 0:
-                    break
-            finally:
-                sock.close()
-        else:
+        if not self._wait_for_port(max_wait):
             raise RuntimeError(
                 f"Server did not start accepting connections within {max_wait} seconds"
+                " (set MCP_TEST_DEBUG=1 to see server output)"
             )
+        if not self._wait_for_http():
+            raise RuntimeError(
+                f"Server accepted connections but {self.url} did not respond"
+                " (set MCP_TEST_DEBUG=1 to see server output)"
+            )
+    
+    @property
+    def url(self) -> str:
+        """URL of the server's MCP endpoint."""
+        return f"http://127.0.0.1:{self.port}/mcp"
+    
+    def _wait_for_http(self, attempts: int = 20) -> bool:
+        """Wait until the MCP endpoint answers HTTP requests.
+        
+        The port can accept connections before the routes are wired up, so a
+        request to /mcp is the real readiness check. The endpoint answers a bare
+        HEAD with a 3xx/4xx; a 404 means the route is missing, so it is not ready.
+        """
+        for _ in range(attempts):
+            try:
+                status = httpx.head(self.url, timeout=0.2).status_code
+                if status < 500 and status != 404:
+                    return True
+            except httpx.TransportError:
+                pass  # Refused, reset or timed out, retry
+            time.sleep(0.05)
+        return False
+    
+    def _wait_for_port(self, max_wait: float) -> bool:
+        """Wait until the server port accepts TCP connections.
+        
+        Uses a non-blocking connect and select() on writability with exponential
+        backoff (10ms up to 200ms), so we return within one round-trip of the
+        server binding instead of sleeping in fixed 500ms steps. The same socket
+        is kept while its connect is pending; it is only replaced once the attempt
+        has failed, since a failed socket cannot portably be reconnected.
+        """
+        deadline = time.monotonic() + max_wait
+        delay = 0.01
+        sock: Optional[socket.socket] = None
+        
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                step = min(delay, remaining)
+                delay = min(delay * 2, 0.2)
+                
+                if sock is None:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.setblocking(False)
+                    result = sock.connect_ex(("127.0.0.1", self.port))
+                    if result in (0, errno.EISCONN):
+                        return True
+                    if result not in _CONNECT_PENDING:
+                        sock.close()
+                        sock = None
+                        time.sleep(step)
+                        continue
+                
+                # Wait on the pending connect, select() sleeps up to `step`.
+                # Winsock reports a failed connect only in exceptfds, never as writable
+                _, writable, failed = select.select([], [sock], [sock], step)
+                if not writable and not failed:
+                    continue
+                if not failed and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    return True
+                
+                # Refused, the server is not listening yet
+                sock.close()
+                sock = None
+                time.sleep(step)
+        finally:
+            if sock is not None:
+                sock.close()
     
     def stop(self) -> None:
         """Stop the Streamable HTTP server with multiple fallback strategies."""
@@ -100,31 +282,24 @@ class StreamableHTTPServer:
             return
         
         try:
-            # Try graceful termination first
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                # Force kill if termination didn't work
-                self.process.kill()
+            # Try graceful termination first, then kill()
+            _terminate_process(self.process, timeout=2)
+        except subprocess.TimeoutExpired:
+            # Use OS-level kill as last resort, unless the process exited meanwhile
+            if self.process.pid and _pid_alive(self.process.pid):
                 try:
-                    self.process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    # Use OS-level kill as last resort
-                    if self.process.pid:
-                        try:
-                            # Windows doesn't have SIGKILL, use platform-appropriate method
-                            if sys.platform == "win32":
-                                # On Windows, forcefully terminate the process
-                                import ctypes
-                                kernel32 = ctypes.windll.kernel32
-                                handle = kernel32.OpenProcess(1, False, self.process.pid)
-                                kernel32.TerminateProcess(handle, 1)
-                                kernel32.CloseHandle(handle)
-                            else:
-                                os.kill(self.process.pid, signal.SIGKILL)
-                        except (ProcessLookupError, OSError):
-                            pass  # Process already dead
+                    # Windows doesn't have SIGKILL, use platform-appropriate method
+                    if sys.platform == "win32":
+                        # On Windows, forcefully terminate the process
+                        import ctypes
+                        kernel32 = ctypes.windll.kernel32
+                        handle = kernel32.OpenProcess(1, False, self.process.pid)
+                        kernel32.TerminateProcess(handle, 1)
+                        kernel32.CloseHandle(handle)
+                    else:
+                        os.kill(self.process.pid, signal.SIGKILL)
+                except (ProcessLookupError, OSError):
+                    pass  # Process already dead
         except Exception as e:
             print(f"Error stopping server: {e}", file=sys.stderr)
         finally:
@@ -138,24 +313,72 @@ class StreamableHTTPServer:
                 self._cleanup_registered = False
     
     def _kill_port_processes(self) -> None:
-        """Kill any processes using the server's port."""
+        """Kill any processes listening on the server's port.
+        
+        Probes the port with a bind first, which is the common case of nothing
+        listening. Only when the port is taken are the owning processes looked up,
+        via ``ss`` where available and a psutil scan of all processes otherwise.
+        """
         try:
-            for proc in psutil.process_iter(['pid']):
+            if not self._port_in_use():
+                return
+            
+            for pid in self._find_port_pids():
+                if pid == os.getpid():
+                    continue
                 try:
-                    # Use net_connections() (available in psutil 7.x+) with fallback to connections()
-                    if hasattr(proc, 'net_connections'):
-                        connections = proc.net_connections()
+                    if sys.platform == "win32":
+                        psutil.Process(pid).kill()
                     else:
-                        connections = proc.connections()
-                    for conn in connections:
-                        if hasattr(conn, 'laddr') and conn.laddr.port == self.port:
-                            proc.kill()
-                            break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        os.kill(pid, signal.SIGKILL)
+                except (ProcessLookupError, psutil.NoSuchProcess, psutil.AccessDenied, OSError):
                     continue
         except Exception as e:
             print(f"Error killing port processes: {e}", file=sys.stderr)
     
+    def _port_in_use(self) -> bool:
+        """Check whether something is listening on the port by trying to bind it."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # On Windows SO_REUSEADDR would let the bind succeed despite a listener
+            if sys.platform != "win32":
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("127.0.0.1", self.port))
+            except OSError as e:
+                if e.errno in (errno.EADDRINUSE, getattr(errno, "WSAEADDRINUSE", None)):
+                    return True
+                raise
+        return False
+    
+    def _find_port_pids(self) -> List[int]:
+        """Return the PIDs of processes listening on the port."""
+        try:
+            result = subprocess.run(
+                ["ss", "-Hltnp", f"sport = :{self.port}"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                return [int(pid) for pid in _SS_PID_RE.findall(result.stdout)]
+        except (OSError, subprocess.SubprocessError):
+            pass  # ss not available (macOS, Windows), scan processes instead
+        
+        pids = []
+        for proc in psutil.process_iter(['pid']):
+            try:
+                # Use net_connections() (available in psutil 7.x+) with fallback to connections()
+                if hasattr(proc, 'net_connections'):
+                    connections = proc.net_connections()
+                else:
+                    connections = proc.connections()
+                if any(hasattr(conn, 'laddr') and conn.laddr and conn.laddr.port == self.port
+                       for conn in connections):
+                    pids.append(proc.pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return pids
+    
     def __enter__(self):
         self.start()
         return self
@@ -178,11 +401,167 @@ class StreamableHTTPServer:
 atexit.register(StreamableHTTPServer.cleanup_all)
 
 
+# Handlers installed before ours (e.g. sitecustomize's coverage saver), by signal
+_previous_handlers = {}
+
+
+def _terminate_handler(signum, frame) -> None:
+    """Clean up servers on termination signals, which bypass atexit handlers."""
+    StreamableHTTPServer.cleanup_all()
+    
+    previous = _previous_handlers.get(signum)
+    if callable(previous):
+        previous(signum, frame)
+        return
+    if previous is signal.SIG_IGN:
+        return  # The signal was ignored before we installed our handler
+    
+    # Previously SIG_DFL (or set outside Python): restore the default action and
+    # re-deliver so the process still terminates
+    signal.signal(signum, signal.SIG_DFL)
+    signal.raise_signal(signum)
+
+
+# CI runners stop jobs with SIGTERM (SIGBREAK on Windows), not KeyboardInterrupt.
+# Signal handlers can only be installed from the main thread.
+if threading.current_thread() is threading.main_thread():
+    _termination_signals = [signal.SIGTERM]
+    if sys.platform == "win32":
+        _termination_signals.append(signal.SIGBREAK)
+    for _signum in _termination_signals:
+        _previous_handlers[_signum] = signal.getsignal(_signum)
+        signal.signal(_signum, _terminate_handler)
+
+
+@dataclass(slots=True)
+class _ToolsResponse:
+    """list_tools() result exposing `.tools` like MCP's ListToolsResult."""
+    tools: list
+
+
+@dataclass(slots=True)
+class _ResourcesResponse:
+    """list_resources() result exposing `.resources` like MCP's ListResourcesResult."""
+    resources: list
+
+
+@dataclass(slots=True)
+class _ReadResourceResponse:
+    """read_resource() result exposing `.contents` like MCP's ReadResourceResult."""
+    contents: list
+
+
+@dataclass(slots=True)
+class _PromptsResponse:
+    """list_prompts() result exposing `.prompts` like MCP's ListPromptsResult."""
+    prompts: list
+
+
+@dataclass(slots=True)
+class _ErrorResult:
+    """call_tool() result for client-side errors, shaped like MCP's CallToolResult."""
+    isError: bool
+    content: list
+    error_text: str
+
+
+class ClientSessionAdapter:
+    """Adapter to make fastmcp Client API compatible with MCP ClientSession API.
+    
+    FastMCP Client returns plain lists from list_tools(), list_resources(),
+    read_resource() and list_prompts() instead of result objects with .tools,
+    .resources, .contents and .prompts attributes, and uses .is_error instead of
+    .isError. Only the methods below are exposed; anything else should go
+    through the wrapped fastmcp client, available as `client`.
+    """
+    
+    def __init__(self, client):
+        self._client = client
+    
+    @property
+    def client(self):
+        """The wrapped fastmcp Client."""
+        return self._client
+    
+    async def initialize(self):
+        """Initialize the session (fastmcp Client already does this on enter)."""
+        return await self._client.initialize()
+    
+    async def send_ping(self):
+        """Ping the server (ClientSession's name for fastmcp's ping())."""
+        return await self._client.ping()
+    
+    async def list_tools(self):
+        """Wrap list_tools to return object with .tools attribute."""
+        return _ToolsResponse(await self._client.list_tools())
+    
+    async def list_resources(self):
+        """Wrap list_resources to return object with .resources attribute."""
+        return _ResourcesResponse(await self._client.list_resources())
+    
+    async def read_resource(self, uri):
+        """Wrap read_resource to return object with .contents attribute."""
+        return _ReadResourceResponse(await self._client.read_resource(uri))
+    
+    async def list_prompts(self):
+        """Wrap list_prompts to return object with .prompts attribute."""
+        return _PromptsResponse(await self._client.list_prompts())
+    
+    async def get_prompt(self, name: str, arguments: Optional[dict] = None):
+        """Render a server prompt (fastmcp already returns MCP's GetPromptResult)."""
+        return await self._client.get_prompt(name, arguments)
+    
+    async def call_tool(self, name: str, arguments: Optional[dict] = None):
+        """Call tool with same signature as MCP ClientSession, wrapping results."""
+        if arguments is None:
+            arguments = {}
+        
+        try:
+            result = await self._client.call_tool(name, arguments)
+            return self._wrap_result(result)
+        except Exception as e:
+            from mcp import types
+            error_text = str(e)
+            error_content = [types.TextContent(type="text", text=error_text)]
+            return self._wrap_error_result(error_text, error_content)
+    
+    def _wrap_result(self, result):
+        """Wrap CallToolResult to add .isError attribute for compatibility."""
+        if isinstance(result, list):
+            return [self._wrap_result(r) for r in result]
+        
+        if not hasattr(result, 'isError'):
+            # object.__setattr__ also works if the result type guards attribute assignment
+            object.__setattr__(result, 'isError', getattr(result, 'is_error', False))
+        return result
+    
+    def _wrap_error_result(self, error_text: str, content: list):
+        """Create a result object that looks like an MCP error result."""
+        return _ErrorResult(isError=True, content=content, error_text=error_text)
+
+
 # Skip streamable-http if not available
 TRANSPORTS = ["stdio"]
 if HAS_STREAMABLE_HTTP:
     TRANSPORTS.append("http")
 
+@pytest.fixture(scope="session")
+def _http_server(request) -> StreamableHTTPServer:
+    """Provide a Streamable HTTP server shared by all HTTP tests in the session.
+    
+    Starting the server means spawning Python, importing FastMCP and initializing
+    logging, so it is done once rather than per test. The finalizer guarantees the
+    server is stopped even if the session ends with errors.
+    
+    Server output is discarded; run with MCP_TEST_DEBUG=1 to see it when
+    debugging failing HTTP tests.
+    """
+    server = StreamableHTTPServer({{ cookiecutter.server_port }})
+    request.addfinalizer(server.stop)
+    server.start()
+    return server
+
+
 @pytest.fixture(params=TRANSPORTS)
 async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None]:
     """Provide an MCP client session for testing with multiple transports.
@@ -191,6 +570,10 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
     transports automatically. Includes bulletproof cleanup that guarantees
     all resources are released even if tests fail catastrophically.
     
+    To run a test against a single transport, parametrize it indirectly:
+    
+        @pytest.mark.parametrize("mcp_session", ["stdio"], indirect=True)
+    
     Args:
         request: pytest request object containing the transport parameter
         
@@ -200,73 +583,31 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
     transport = request.param
     session = None
     cleanup_funcs = []
-    server_instance = None  # Track server for guaranteed cleanup
-    stdio_proc = None  # Track stdio subprocess
-    
-    # Register pytest finalizer for guaranteed cleanup
-    def emergency_cleanup():
-        """Emergency cleanup that runs no matter what."""
-        # Clean up any streamable HTTP servers
-        if server_instance:
-            try:
-                server_instance.stop()
-            except Exception as e:
-                print(f"Emergency cleanup of server failed: {e}", file=sys.stderr)
-        
-        # Clean up any stdio processes
-        if stdio_proc:
-            try:
-                stdio_proc.terminate()
-                stdio_proc.wait(timeout=2)
-            except Exception:
-                try:
-                    stdio_proc.kill()
-                except Exception:
-                    pass
-    
-    request.addfinalizer(emergency_cleanup)
+    # The stdio subprocess is owned by stdio_client and the HTTP server by the
+    # session-scoped _http_server fixture, so both are cleaned up by their owners
     
     try:
         if transport == "stdio":
             # Setup STDIO transport
-            project_root = Path(__file__).parent.parent.parent
-            server_module = "{{ cookiecutter.__project_slug }}.server.app"
-            
             # Build environment with coverage support
             env = get_default_environment()
             
             # Add coverage-related environment variables if they exist
-            coverage_vars = [
-                "COVERAGE_PROCESS_START",
-                "COVERAGE_FILE",
-                "COVERAGE_CORE",
-                "COV_CORE_SOURCE",
-                "COV_CORE_CONFIG",
-                "COV_CORE_DATAFILE",
-            ]
-            
-            for var in coverage_vars:
-                if var in os.environ:
-                    env[var] = os.environ[var]
+            env.update({k: v for k, v in os.environ.items() if k in _COVERAGE_VARS})
             
             # Add PYTHONPATH
-            if "PYTHONPATH" in os.environ:
-                env["PYTHONPATH"] = os.environ["PYTHONPATH"]
-            else:
-                env["PYTHONPATH"] = str(project_root)
+            env["PYTHONPATH"] = os.environ.get("PYTHONPATH", str(_PROJECT_ROOT))
             
             # Create server parameters
             server_params = StdioServerParameters(
                 command=sys.executable,
-                args=["-m", server_module, "--transport", "stdio"],
+                args=["-m", _SERVER_MODULE, "--transport", "stdio"],
                 env=env
             )
             
             # Start stdio client
-            # Try with errlog parameter (SAAGA compatibility) then fallback
-            import inspect
-            sig = inspect.signature(stdio_client)
-            if 'errlog' in sig.parameters:
+            # Pass errlog when supported (SAAGA compatibility)
+            if _STDIO_CLIENT_HAS_ERRLOG:
                 stdio_context = stdio_client(server_params, errlog=sys.stderr)
             else:
                 stdio_context = stdio_client(server_params)
@@ -289,82 +630,16 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
             if not HAS_STREAMABLE_HTTP:
                 pytest.skip("streamable_http module not available")
             
-            # Setup Streamable HTTP transport
-            port = {{ cookiecutter.server_port }}
-            
-            # Start server in subprocess
-            server = StreamableHTTPServer(port)
-            server_instance = server  # Track for emergency cleanup
-            server.start()
+            # Reuse the session-wide server, started on first use
+            server = request.getfixturevalue("_http_server")
             
             # Connect via Streamable HTTP using fastmcp Client
-            url = f"http://127.0.0.1:{port}/mcp"
-            http_transport = StreamableHttpTransport(url=url)
+            http_transport = StreamableHttpTransport(url=server.url)
             client = Client(http_transport)
             
             # Enter the client context
             await client.__aenter__()
             
-            # Wrap client to provide MCP ClientSession-compatible API
-            # FastMCP Client returns list[Tool] from list_tools() instead of object with .tools attribute
-            # and uses .is_error instead of .isError
-            class ClientSessionAdapter:
-                """Adapter to make fastmcp Client API compatible with MCP ClientSession API."""
-                
-                def __init__(self, client):
-                    self._client = client
-                
-                async def list_tools(self):
-                    """Wrap list_tools to return object with .tools attribute."""
-                    tools = await self._client.list_tools()
-                    
-                    class ToolsResponse:
-                        def __init__(self, tools_list):
-                            self.tools = tools_list
-                    
-                    return ToolsResponse(tools)
-                
-                async def call_tool(self, name: str, arguments: Optional[dict] = None):
-                    """Call tool with same signature as MCP ClientSession, wrapping results."""
-                    if arguments is None:
-                        arguments = {}
-                    
-                    try:
-                        result = await self._client.call_tool(name, arguments)
-                        return self._wrap_result(result)
-                    except Exception as e:
-                        from mcp import types
-                        error_text = str(e)
-                        error_content = [types.TextContent(type="text", text=error_text)]
-                        return self._wrap_error_result(error_text, error_content)
-                
-                def _wrap_result(self, result):
-                    """Wrap CallToolResult to add .isError attribute for compatibility."""
-                    if isinstance(result, list):
-                        return [self._wrap_result(r) for r in result]
-                    
-                    if not hasattr(result, 'isError'):
-                        if hasattr(result, 'is_error'):
-                            result.isError = result.is_error
-                        else:
-                            result.isError = False
-                    return result
-                
-                def _wrap_error_result(self, error_text: str, content: list):
-                    """Create a result object that looks like an MCP error result."""
-                    from mcp import types
-                    
-                    class ErrorResult:
-                        def __init__(self, content, error_text):
-                            self.isError = True
-                            self.content = content
-                            self.error_text = error_text
-                    
-                    return ErrorResult(content, error_text)
-                
-                def __getattr__(self, name):
-                    return getattr(self._client, name)
-            
             session = ClientSessionAdapter(client)
             
             # Add cleanup for HTTP
@@ -373,11 +648,6 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                     await client.__aexit__(None, None, None)
                 except Exception as e:
                     print(f"Session cleanup error: {e}", file=sys.stderr)
-                
-                try:
-                    server.stop()
-                except Exception as e:
-                    print(f"Server stop error: {e}", file=sys.stderr)
             
             cleanup_funcs.append(cleanup_http)
         
@@ -396,28 +666,6 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                 print(f"Cleanup error: {e}", file=sys.stderr)
 
 
-@pytest.fixture
-async def stdio_session() -> AsyncGenerator[ClientSession, None]:
-    """Provide a STDIO-only MCP client session for specific tests.
-    
-    Use this fixture when you need to test STDIO-specific functionality.
-    """
-    async for session, transport in mcp_session(pytest.FixtureRequest(param="stdio")):
-        if transport == "stdio":
-            yield session
-
-
-@pytest.fixture  
-async def streamable_http_session() -> AsyncGenerator[ClientSession, None]:
-    """Provide a Streamable HTTP-only MCP client session for specific tests.
-    
-    Use this fixture when you need to test Streamable HTTP-specific functionality.
-    """
-    async for session, transport in mcp_session(pytest.FixtureRequest(param="http")):
-        if transport == "http":
-            yield session
-
-
 # Helper functions for tests
 
 def extract_text_content(result) -> Optional[str]:
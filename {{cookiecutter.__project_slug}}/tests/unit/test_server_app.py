@@ -0,0 +1,86 @@
+"""Tests for lazy server creation in server/app.py.
+
+Importing the package or running `--help` must not build the MCP server
+(which initializes logging and opens the SQLite destination), while the
+package-level `server` export must still resolve to the FastMCP instance.
+"""
+
+import types
+
+import pytest
+from click.testing import CliRunner
+from fastmcp import FastMCP
+
+import {{cookiecutter.__project_slug}}
+from {{cookiecutter.__project_slug}}.server import app
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """Replace create_mcp_server with a cheap FastMCP factory and reset the cache."""
+    calls = []
+    
+    def create_fake_server():
+        calls.append(True)
+        return FastMCP("test-server")
+    
+    monkeypatch.setattr(app, "_server", None)
+    monkeypatch.setattr(app, "create_mcp_server", create_fake_server)
+    return calls
+
+
+class TestLazyServer:
+    """Test that the server is only created on first access."""
+    
+    def test_package_server_is_fastmcp_instance(self, fake_server):
+        """Test that `pkg.server` is the FastMCP instance, not the subpackage."""
+        server = {{cookiecutter.__project_slug}}.server
+        
+        assert not isinstance(server, types.ModuleType)
+        assert isinstance(server, FastMCP)
+        assert len(fake_server) == 1
+    
+    def test_from_import_server(self, fake_server):
+        """Test that `from pkg import server` returns the shared instance."""
+        from {{cookiecutter.__project_slug}} import server
+        
+        assert isinstance(server, FastMCP)
+        assert server is app.get_server()
+        assert len(fake_server) == 1
+    
+    def test_help_does_not_create_server(self, fake_server):
+        """Test that `--help` exits without building the server."""
+        result = CliRunner().invoke(app.main, ["--help"])
+        
+        assert result.exit_code == 0
+        assert "--transport" in result.output
+        assert fake_server == []
+        assert app._server is None
+
+
+class TestTransportEntryPoints:
+    """Test the per-transport convenience entry points."""
+    
+    def test_command_line_overrides_are_forwarded(self, monkeypatch, fake_server):
+        """Test that options given to main_http reach main with the http transport."""
+        received = {}
+        monkeypatch.setattr(app.main, "callback", lambda **kwargs: received.update(kwargs))
+        monkeypatch.setattr(app.sys, "argv", ["server-http", "--port", "8080"])
+        
+        with pytest.raises(SystemExit) as exc_info:
+            app.main_http()
+        
+        assert exc_info.value.code == 0
+        assert received == {"port": 8080, "host": "127.0.0.1", "transport": "http"}
+        assert app.sys.argv == ["server-http", "--port", "8080"]
+    
+    def test_help_prints_usage(self, monkeypatch, capsys, fake_server):
+        """Test that --help on a wrapper prints help instead of starting a server."""
+        monkeypatch.setattr(app.sys, "argv", ["server-http", "--help"])
+        
+        with pytest.raises(SystemExit) as exc_info:
+            app.main_http()
+        
+        assert exc_info.value.code == 0
+        assert "--transport" in capsys.readouterr().out
+        assert fake_server == []
@@ -3,11 +3,25 @@
 import asyncio
 import logging
 import sys
-from {{cookiecutter.__project_slug}}.server.app import server, create_mcp_server
+from typing import Any
+from {{cookiecutter.__project_slug}}.server.app import create_mcp_server, get_server
+
+# Importing server.app binds the `server` subpackage as an attribute of this
+# package, which would shadow __getattr__ below; drop it so `server` resolves
+# to the FastMCP instance as before
+del server
 
 __version__ = "0.1.0"
 __all__ = ["server", "create_mcp_server"]
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve `server` lazily so importing the package does not start logging."""
+    if name == "server":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main(transport: str = "stdio"):
     """Entry point for MCP server
 
@@ -17,9 +31,9 @@ def main(transport: str = "stdio"):
     try:
         logger = logging.getLogger(__name__)
         if transport == "stdio":
-            asyncio.run(server.run_stdio_async())
+            asyncio.run(get_server().run_stdio_async())
         else:
-            asyncio.run(server.run_sse_async())
+            asyncio.run(get_server().run_sse_async())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -5,6 +5,13 @@ import click
 from fastmcp import Client
 from fastmcp.client.transports import StdioTransport
 
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 
 @click.command()
 @click.argument("message", type=str)
@@ -26,7 +33,9 @@ def main(message: str):
             # Result is accessed via .data property
             return result.data
     
-    response = asyncio.run(run_client())
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        response = runner.run(run_client())
     print(response)
 
 
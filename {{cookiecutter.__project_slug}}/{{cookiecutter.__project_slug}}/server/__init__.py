@@ -1,9 +1,14 @@
 """MCP server package initialization"""
 
-from {{cookiecutter.__project_slug}}.config import load_config
-from {{cookiecutter.__project_slug}}.server.app import create_mcp_server
+from typing import Any
 
-# Create server instance with default configuration
-server = create_mcp_server(load_config())
+from {{cookiecutter.__project_slug}}.server.app import create_mcp_server, get_server
 
 __all__ = ["server", "create_mcp_server"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `server` to the shared instance, created on first access."""
+    if name == "server":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
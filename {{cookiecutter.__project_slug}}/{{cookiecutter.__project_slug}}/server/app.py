@@ -21,6 +21,10 @@ from {{ cookiecutter.__project_slug }}.log_system.correlation import (
     clear_initialization_correlation_id
 )
 from {{ cookiecutter.__project_slug }}.log_system.unified_logger import UnifiedLogger
+from {{ cookiecutter.__project_slug }}.decorators.exception_handler import exception_handler
+from {{ cookiecutter.__project_slug }}.decorators.tool_logger import tool_logger
+from {{ cookiecutter.__project_slug }}.decorators.type_converter import type_converter
+from {{ cookiecutter.__project_slug }}.decorators.parallelize import parallelize
 
 from {{ cookiecutter.__project_slug }}.tools.example_tools import example_tools, parallel_example_tools
 
@@ -110,16 +114,13 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     import logging
     unified_logger = logging.getLogger('{{ cookiecutter.__project_slug }}')
     
-    # Import decorators
-    from {{ cookiecutter.__project_slug }}.decorators.exception_handler import exception_handler
-    from {{ cookiecutter.__project_slug }}.decorators.tool_logger import tool_logger
-    from {{ cookiecutter.__project_slug }}.decorators.type_converter import type_converter
-    from {{ cookiecutter.__project_slug }}.decorators.parallelize import parallelize
+    # Config passed to tool_logger, shared by all tools
+    config_dict = config.__dict__
     
     # Register regular tools with decorators
     for tool_func in example_tools:
         # Apply decorator chain: exception_handler → tool_logger → type_converter
-        decorated_func = exception_handler(tool_logger(type_converter(tool_func), config.__dict__))
+        decorated_func = exception_handler(tool_logger(type_converter(tool_func), config_dict))
         
         # The decorated function preserves the original __name__
         tool_name = decorated_func.__name__
@@ -134,7 +135,7 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     for tool_func in parallel_example_tools:
         # Apply decorator chain: exception_handler → tool_logger → parallelize(type_converter)
         # Note: type_converter is applied to the base function before parallelize
-        decorated_func = exception_handler(tool_logger(parallelize(type_converter(tool_func)), config.__dict__))
+        decorated_func = exception_handler(tool_logger(parallelize(type_converter(tool_func)), config_dict))
         
         # The decorated function preserves the original __name__
         tool_name = decorated_func.__name__
@@ -148,8 +149,23 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     unified_logger.info(f"Server '{mcp_server.name}' initialized with decorators")
 
 
-# Create a server instance that can be imported by the MCP CLI
-server = create_mcp_server()
+# Server instance shared by the CLI entry points and the MCP CLI, created on first use
+_server: Optional[FastMCP] = None
+
+
+def get_server() -> FastMCP:
+    """Return the module-level server instance, creating it on first use."""
+    global _server
+    if _server is None:
+        _server = create_mcp_server()
+    return _server
+
+
+def __getattr__(name: str) -> Any:
+    """Create `server` lazily so importing this module (e.g. for --help) has no side effects."""
+    if name == "server":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @click.command()
@@ -174,13 +190,13 @@ def main(port: int, host: str, transport: str) -> int:
     try:
         if transport == "stdio":
             logger.info("Starting server with STDIO transport")
-            server.run(transport="stdio")
+            get_server().run(transport="stdio")
         elif transport == "sse":
             logger.info(f"Starting server with SSE transport on {host}:{port}")
-            server.run(transport="sse", host=host, port=port)
+            get_server().run(transport="sse", host=host, port=port)
         elif transport == "http":
             logger.info(f"Starting server with HTTP transport on {host}:{port}")
-            server.run(transport="http", host=host, port=port, path="/mcp")
+            get_server().run(transport="http", host=host, port=port, path="/mcp")
         else:
             raise ValueError(f"Unknown transport: {transport}")
         return 0
@@ -193,21 +209,15 @@ def main(port: int, host: str, transport: str) -> int:
 
 def main_stdio() -> int:
     """Entry point for STDIO transport (convenience wrapper)."""
-    import sys
-    sys.argv = [sys.argv[0], "--port", "{{ cookiecutter.server_port }}", "--host", "127.0.0.1", "--transport", "stdio"] + sys.argv[1:]
-    return main()
+    return main.main(args=["--transport", "stdio", *sys.argv[1:]])
 
 def main_http() -> int:
     """Entry point for HTTP transport (convenience wrapper)."""
-    import sys
-    sys.argv = [sys.argv[0], "--port", "{{ cookiecutter.server_port }}", "--host", "127.0.0.1", "--transport", "http"] + sys.argv[1:]
-    return main()
+    return main.main(args=["--transport", "http", *sys.argv[1:]])
 
 def main_sse() -> int:
     """Entry point for SSE transport (convenience wrapper)."""
-    import sys
-    sys.argv = [sys.argv[0], "--port", "{{ cookiecutter.server_port }}", "--host", "127.0.0.1", "--transport", "sse"] + sys.argv[1:]
-    return main()
+    return main.main(args=["--transport", "sse", *sys.argv[1:]])
 
 
 if __name__ == "__main__":